@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -9,7 +10,7 @@ import numpy as np
 
 from forex.backtest.metrics import compute_metrics
 from forex.logging_config import get_logger
-from forex.strategy.base import Strategy, StrategyContext
+from forex.strategy.base import Strategy, StrategyContext, signal_getter
 from forex.utils.types import Price
 
 logger = get_logger(__name__)
@@ -76,11 +77,15 @@ class Backtester:
         equity_curve: list[dict] = []
         trades: list[dict] = []
         returns: list[float] = []
+        # Decide once per run instead of building the extra dict for every
+        # fill when INFO records would be filtered out anyway.
+        log_trades = logger.isEnabledFor(logging.INFO)
+        get_signal = signal_getter(self.strategy)
         for candle in candles:
             price = candle.to_price(self.config.instrument, self.config.spread)
             self.strategy.on_price_tick(price)
             self.strategy.on_bar_close(price)
-            signal = getattr(self.strategy, "get_signal", lambda: None)()
+            signal = get_signal()
             if signal and len(self.positions) < self.config.max_positions:
                 direction = 1 if signal.side == "buy" else -1
                 entry_price = price.ask if direction > 0 else price.bid
@@ -97,10 +102,11 @@ class Backtester:
                         "time": candle.time,
                     }
                 )
-                logger.info(
-                    "backtest_trade_open",
-                    extra={"instrument": self.config.instrument, "side": signal.side, "units": units, "time": candle.time.isoformat()},
-                )
+                if log_trades:
+                    logger.info(
+                        "backtest_trade_open",
+                        extra={"instrument": self.config.instrument, "side": signal.side, "units": units, "time": candle.time.isoformat()},
+                    )
             closed_positions: list[dict] = []
             for position in self.positions:
                 direction = position["direction"]
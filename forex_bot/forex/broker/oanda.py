@@ -31,14 +31,19 @@ def _headers() -> dict[str, str]:
     return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
 
-def _client() -> httpx.AsyncClient:
-    return httpx.AsyncClient(timeout=httpx.Timeout(10.0, read=20.0), headers=_headers())
+def _client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, read=20.0), headers=_headers(), transport=transport
+    )
 
 
 class OandaBroker:
     name = "oanda"
 
-    def __init__(self) -> None:
+    def __init__(self, *, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """``transport`` replaces the network layer, e.g. ``httpx.MockTransport`` in tests."""
+
+        self._transport = transport
         self.settings = get_settings(reload=True)
         if not self.settings.oanda_account_id:
             msg = "OANDA_ACCOUNT_ID is required"
@@ -49,7 +54,7 @@ class OandaBroker:
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(), retry=retry_if_exception_type(httpx.HTTPError))
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
-        async with _client() as client:
+        async with _client(self._transport) as client:
             response = await client.request(method, f"{OANDA_API}{path}", **kwargs)
             if response.status_code == 429:
                 raise httpx.HTTPStatusError("Rate limited", request=response.request, response=response)
@@ -81,7 +86,7 @@ class OandaBroker:
 
     async def price_stream(self, instruments: Iterable[str]) -> AsyncIterator[Price]:
         params = {"instruments": ",".join(instruments), "snapshot": "false"}
-        async with httpx.AsyncClient(timeout=None, headers=_headers()) as client:
+        async with httpx.AsyncClient(timeout=None, headers=_headers(), transport=self._transport) as client:
             async with client.stream(
                 "GET",
                 f"{OANDA_STREAM}/accounts/{self.settings.oanda_account_id}/pricing/stream",
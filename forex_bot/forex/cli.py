@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import json
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Coroutine, Optional, TypeVar
 
 import typer
 
@@ -16,11 +17,33 @@ from forex.config import Settings, get_settings
 from forex.data.candles_store import CandleStore
 from forex.data.models import Candle
 from forex.logging_config import configure_logging, get_logger
+from forex.strategy.base import signal_getter
 from forex.strategy.registry import UnknownStrategyError, create_strategy
 
 app = typer.Typer(help="Forex paper trading CLI")
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+class LogLevel(str, Enum):
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+    CRITICAL = "CRITICAL"
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on uvloop when it is installed, else on the default loop."""
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
 
 def load_strategy(name: str):
     try:
@@ -40,8 +63,11 @@ def main(
     ctx: typer.Context,
     config: Annotated[Path, typer.Option(".env", help="Config file path")] = Path(".env"),
     debug: bool = typer.Option(False, "--debug"),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level", case_sensitive=False, help="Override the INFO log threshold"
+    ),
 ) -> None:
-    configure_logging(debug)
+    configure_logging(debug, level=log_level.value if log_level else None)
     if config.exists():
         ctx.obj = Settings(_env_file=str(config))
     else:
@@ -64,14 +90,15 @@ def run_live(
     async def _run() -> None:
         account = await broker.get_account()
         logger.info("account", extra=account)
+        get_signal = signal_getter(strat)
         async for price in broker.price_stream([instrument]):
             strat.on_price_tick(price)
             strat.on_bar_close(price)
-            signal = getattr(strat, "get_signal", lambda: None)()
+            signal = get_signal()
             if signal:
                 logger.info("signal", extra={"side": signal.side, "reason": signal.reason})
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command()
@@ -100,17 +127,20 @@ def backtest(
         import pandas as pd
 
         df = pd.read_csv(data_csv)
-        for _, row in df.iterrows():
-            candles.append(
-                CandleBar(
-                    time=datetime.fromisoformat(row["time"]),
-                    open=row["open"],
-                    high=row["high"],
-                    low=row["low"],
-                    close=row["close"],
-                    volume=row.get("volume", 0),
-                )
+        # Column-wise: pull each field out once as plain Python values
+        # instead of materialising a Series per row with iterrows().
+        volumes = df["volume"].tolist() if "volume" in df else [0] * len(df)
+        candles.extend(
+            map(
+                CandleBar,
+                map(datetime.fromisoformat, df["time"].tolist()),
+                df["open"].tolist(),
+                df["high"].tolist(),
+                df["low"].tolist(),
+                df["close"].tolist(),
+                volumes,
             )
+        )
     else:
         store = CandleStore()
         stored = store.load_candles(instrument, granularity)
@@ -163,7 +193,7 @@ def import_candles(
             )
     else:
         broker = load_broker(settings)
-        data = asyncio.run(
+        data = run_async(
             broker.get_candles(instrument=instrument, granularity=granularity, count=days * 24)
         )
         for item in data:
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
         populate_by_name=True,
+        frozen=True,
     )
 
     broker: Literal["oanda", "paper"] = Field(default="oanda", alias="BROKER")
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional
 from forex.broker.base import Broker
 from forex.execution.risk import RiskParameters, position_size
 from forex.logging_config import get_logger
-from forex.strategy.base import Signal, Strategy
+from forex.strategy.base import Signal, Strategy, signal_getter
 from forex.utils.types import OrderRequest, Price
 from forex.utils.time import utc_now
 
@@ -40,6 +40,7 @@ class Executor:
         self.open_positions: list[dict] = []
         self.event_bus = event_bus
         self.on_trade = on_trade
+        self._get_signal = signal_getter(strategy)
 
     async def handle_signal(self, signal: Signal) -> None:
         if len(self.open_positions) >= self.config.max_positions:
@@ -96,7 +97,7 @@ class Executor:
 
     async def run_bar(self, price: Price) -> None:
         self.strategy.on_bar_close(price)
-        signal = getattr(self.strategy, "get_signal", lambda: None)()
+        signal = self._get_signal()
         if signal:
             await self.handle_signal(signal)
 
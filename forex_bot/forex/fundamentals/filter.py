@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,6 +20,8 @@ class FundamentalFilter:
     def __init__(self, config: FundamentalFilterConfig | None = None) -> None:
         self.config = config or FundamentalFilterConfig()
         self._events: list[dict[str, Any]] | None = None
+        # Event times in the same (sorted) order as _events, for bisect.
+        self._times: list[datetime] = []
 
     def load_events(self) -> list[dict[str, Any]]:
         if self._events is not None:
@@ -33,7 +36,9 @@ class FundamentalFilter:
         for entry in payload:
             when = datetime.fromisoformat(entry["time"])
             events.append({"time": when, "impact": entry.get("impact", "medium"), "instruments": entry.get("instruments", [])})
+        events.sort(key=lambda event: event["time"])
         self._events = events
+        self._times = [event["time"] for event in events]
         return self._events
 
     def should_trade_now(self, now: datetime, instrument: str) -> bool:
@@ -42,12 +47,14 @@ class FundamentalFilter:
             return True
         events = self.load_events()
         window = timedelta(minutes=minutes)
-        for event in events:
-            event_time: datetime = event["time"]
-            if event["instruments"] and instrument not in event["instruments"]:
-                continue
-            if abs((event_time - now).total_seconds()) <= window.total_seconds():
+        times = self._times
+        end = now + window
+        index = bisect_left(times, now - window)
+        while index < len(times) and times[index] <= end:
+            instruments = events[index]["instruments"]
+            if not instruments or instrument in instruments:
                 return False
+            index += 1
         return True
 
 
@@ -26,10 +26,15 @@ class JsonFormatter(jsonlogger.JsonFormatter):
             log_record.setdefault("args", record.args)
 
 
-def configure_logging(debug: bool = False) -> None:
-    """Configure application logging."""
+def configure_logging(debug: bool = False, level: str | None = None) -> None:
+    """Configure application logging.
 
-    level = "DEBUG" if debug else DEFAULT_LOG_LEVEL
+    ``level`` overrides the default INFO threshold (e.g. ``"WARNING"`` for
+    unattended live runs, which drops per-order records before they are
+    formatted); ``debug`` still wins when set.
+    """
+
+    level = "DEBUG" if debug else (level or DEFAULT_LOG_LEVEL).upper()
     formatter = JsonFormatter("%(timestamp)s %(level)s %(name)s %(message)s")
 
     logging_config = {
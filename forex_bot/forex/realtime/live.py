@@ -287,9 +287,16 @@ class LiveRunner:
         except asyncio.CancelledError:
             pass
 
-    async def _refresh_metrics(self, run_id: str, *, emit_event: bool = True) -> None:
+    async def _refresh_metrics(
+        self, run_id: str, *, emit_event: bool = True, positions_changed: bool = False
+    ) -> None:
         account = await self._broker.get_account()
-        positions = await self._broker.get_open_positions()
+        # Positions only appear through recorded trades, so while the session
+        # is flat the periodic refresh can skip the broker's position listing.
+        if positions_changed or self._state.open_positions:
+            open_positions = len(await self._broker.get_open_positions())
+        else:
+            open_positions = 0
         equity = self._extract_equity(account)
         timestamp = utc_now()
         hit_target = False
@@ -305,7 +312,7 @@ class LiveRunner:
                 state.daily_return_pct = ((equity - state.start_equity) / state.start_equity) * 100
             elif equity is None:
                 state.daily_return_pct = None
-            state.open_positions = len(positions)
+            state.open_positions = open_positions
             state.timestamp = timestamp
             config = self._current_config
             if config and state.daily_return_pct is not None:
@@ -339,7 +346,7 @@ class LiveRunner:
         run_id = self._current_run_id
         if not run_id:
             return None
-        await self._refresh_metrics(run_id, emit_event=False)
+        await self._refresh_metrics(run_id, emit_event=False, positions_changed=True)
         async with self._state_lock:
             self._state.timestamp = utc_now()
             payload = self._state.as_dict()
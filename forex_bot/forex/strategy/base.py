@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Callable, Protocol
 
 from forex.utils.types import Price
 
@@ -49,4 +49,14 @@ class Signal:
         self.metadata = metadata or {}
 
 
-__all__ = ["Strategy", "StrategyContext", "Signal"]
+def _no_signal() -> Signal | None:
+    return None
+
+
+def signal_getter(strategy: Strategy) -> Callable[[], Signal | None]:
+    """Resolve a strategy's optional ``get_signal`` once, for use in bar loops."""
+
+    return getattr(strategy, "get_signal", _no_signal)
+
+
+__all__ = ["Strategy", "StrategyContext", "Signal", "signal_getter"]
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
+import numpy as np
+
 from forex.fundamentals.filter import FundamentalFilter, FundamentalFilterConfig
 from forex.strategy.base import Signal, Strategy, StrategyContext
 from forex.ta.indicators import ATRState, MACDState, RSIState, EMAState
@@ -12,6 +14,16 @@ from forex.utils.math import pip_size
 from forex.utils.types import Price
 
 
+BAR_HISTORY = 500
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Trend directions each ``trade_sides`` setting lets through.
+TRADE_SIDES = {
+    "both": frozenset({"buy", "sell"}),
+    "long": frozenset({"buy"}),
+    "short": frozenset({"sell"}),
+}
+
 DEFAULT_PATTERNS = [
     "engulfing",
     "hammer",
@@ -58,18 +70,20 @@ class MurphyCandlesConfig:
     trade_sides: str = "both"
 
 
-def _extract_bar(price: Price) -> dict[str, float]:
-    bar = (price.metadata or {}).get("bar") if price.metadata else None
+def _extract_bar(price: Price) -> tuple[float, float, float, float, float]:
+    metadata = price.metadata
+    bar = metadata.get("bar") if metadata else None
+    mid = price.mid
     if not bar:
-        mid = price.mid
-        return {"open": mid, "high": mid, "low": mid, "close": mid, "volume": 0.0}
-    return {
-        "open": float(bar.get("open", price.mid)),
-        "high": float(bar.get("high", price.mid)),
-        "low": float(bar.get("low", price.mid)),
-        "close": float(bar.get("close", price.mid)),
-        "volume": float(bar.get("volume", 0.0)),
-    }
+        return (mid, mid, mid, mid, 0.0)
+    get = bar.get
+    return (
+        float(get("open", mid)),
+        float(get("high", mid)),
+        float(get("low", mid)),
+        float(get("close", mid)),
+        float(get("volume", 0.0)),
+    )
 
 
 class MurphyCandlesV1Strategy(Strategy):
@@ -78,7 +92,11 @@ class MurphyCandlesV1Strategy(Strategy):
     def __init__(self, config: MurphyCandlesConfig | None = None) -> None:
         self.config = config or MurphyCandlesConfig()
         self.context: StrategyContext | None = None
-        self.signal_bars: list[dict[str, float]] = []
+        # OHLCV rows in BAR_FIELDS order. Twice the history is allocated so
+        # appends are plain row writes, with one block copy every
+        # BAR_HISTORY bars instead of a list.pop(0) per bar.
+        self._bars = np.empty((2 * BAR_HISTORY, len(BAR_FIELDS)), dtype=np.float64)
+        self._bar_count = 0
         self.trend_fast = EMAState(self.config.ta_params["fast_ma"])
         self.trend_slow = EMAState(self.config.ta_params["slow_ma"])
         macd_params = self.config.ta_params.get("macd", [12, 26, 9])
@@ -94,10 +112,23 @@ class MurphyCandlesV1Strategy(Strategy):
         self.last_trade_day: date | None = None
         self.trades_today = 0
         self.cooldown_remaining = 0
+        # Instrument and config constants, resolved once in on_startup().
+        self._pip = 0.0
+        self._max_spread: float | None = None
+        self._allowed_sides: frozenset[str] = frozenset()
+        self._rsi_ob = 70.0
+        self._rsi_os = 30.0
 
     def on_startup(self, context: StrategyContext) -> None:
         self.context = context
-        self.signal_bars.clear()
+        self._pip = pip_size(context.instrument)
+        self._max_spread = (
+            None if self.config.spread_pips is None else self.config.spread_pips * self._pip
+        )
+        self._allowed_sides = TRADE_SIDES.get(self.config.trade_sides, frozenset())
+        self._rsi_ob = self.config.ta_params.get("rsi_ob", 70)
+        self._rsi_os = self.config.ta_params.get("rsi_os", 30)
+        self._bar_count = 0
         self.pending_signal = None
         self.trend_fast = EMAState(self.config.ta_params["fast_ma"])
         self.trend_slow = EMAState(self.config.ta_params["slow_ma"])
@@ -114,22 +145,20 @@ class MurphyCandlesV1Strategy(Strategy):
 
     def on_bar_close(self, price: Price) -> None:
         bar = _extract_bar(price)
-        self.signal_bars.append(bar)
-        if len(self.signal_bars) > 500:
-            self.signal_bars.pop(0)
+        self._append_bar(bar)
+        high, low, close = bar[1], bar[2], bar[3]
         self.cooldown_remaining = max(self.cooldown_remaining - 1, 0)
         self._reset_daily_counters(price.time.date())
         if not self.context:
             return
         if not self.fundamental_filter.should_trade_now(price.time, self.context.instrument):
             return
-        atr = self.atr_state.update(bar["high"], bar["low"], bar["close"])
-        close = bar["close"]
+        atr = self.atr_state.update(high, low, close)
         fast = self.trend_fast.update(close)
         slow = self.trend_slow.update(close)
         rsi = self.rsi_state.update(close)
         macd_line, signal_line, histogram = self.macd_state.update(close)
-        spread_limit = self._spread_limit()
+        spread_limit = self._max_spread
         if spread_limit is not None and price.spread > spread_limit:
             return
         if atr is None or rsi is None:
@@ -141,14 +170,14 @@ class MurphyCandlesV1Strategy(Strategy):
         trend_direction = self._trend_direction(fast, slow, close)
         if trend_direction == "flat":
             return
-        if not self._trade_side_allowed(trend_direction):
+        if trend_direction not in self._allowed_sides:
             return
         if not self._momentum_confirms(trend_direction, macd_line, signal_line, histogram, rsi):
             return
         pattern = self._pattern_confirmation(trend_direction)
         if not pattern:
             return
-        pip = pip_size(self.context.instrument)
+        pip = self._pip
         stop_distance = atr * self.config.atr_mult_sl
         take_profit_distance = atr * self.config.atr_mult_tp
         stop_distance_pips = stop_distance / pip if pip else None
@@ -179,6 +208,19 @@ class MurphyCandlesV1Strategy(Strategy):
         self.cooldown_remaining = self.config.cooldown_bars
         self.trades_today += 1
 
+    @property
+    def signal_bars(self) -> np.ndarray:
+        """The most recent (up to ``BAR_HISTORY``) bars as an ``(n, 5)`` view."""
+
+        return self._bars[max(0, self._bar_count - BAR_HISTORY) : self._bar_count]
+
+    def _append_bar(self, bar: tuple[float, float, float, float, float]) -> None:
+        if self._bar_count == len(self._bars):
+            self._bars[:BAR_HISTORY] = self._bars[-BAR_HISTORY:]
+            self._bar_count = BAR_HISTORY
+        self._bars[self._bar_count] = bar
+        self._bar_count += 1
+
     def on_stop(self) -> None:
         self.pending_signal = None
 
@@ -187,14 +229,6 @@ class MurphyCandlesV1Strategy(Strategy):
         self.pending_signal = None
         return signal
 
-    def _spread_limit(self) -> float | None:
-        if self.config.spread_pips is None:
-            return None
-        if not self.context:
-            return None
-        pip = pip_size(self.context.instrument)
-        return self.config.spread_pips * pip
-
     def _trend_direction(self, fast: float, slow: float, close: float) -> str:
         if fast > slow and close > slow:
             return "buy"
@@ -210,37 +244,19 @@ class MurphyCandlesV1Strategy(Strategy):
         histogram: float,
         rsi: float,
     ) -> bool:
-        rsi_ob = self.config.ta_params.get("rsi_ob", 70)
-        rsi_os = self.config.ta_params.get("rsi_os", 30)
-        if direction == "buy" and rsi >= rsi_ob:
-            return False
-        if direction == "sell" and rsi <= rsi_os:
-            return False
-        if direction == "buy" and (macd_line <= signal_line or histogram <= 0):
-            return False
-        if direction == "sell" and (macd_line >= signal_line or histogram >= 0):
-            return False
-        return True
+        if direction == "buy":
+            return rsi < self._rsi_ob and macd_line > signal_line and histogram > 0
+        return rsi > self._rsi_os and macd_line < signal_line and histogram < 0
 
     def _pattern_confirmation(self, direction: str) -> PatternMatch | None:
-        if not self.signal_bars:
+        if not self._bar_count:
             return None
         matches = detect_patterns(self.signal_bars, self.config.patterns_enabled)
         for match in reversed(matches):
-            if match.direction in {direction, "neutral"}:
+            if match.direction == direction or match.direction == "neutral":
                 return match
         return None
 
-    def _trade_side_allowed(self, direction: str) -> bool:
-        trade_sides = self.config.trade_sides
-        if trade_sides == "both":
-            return True
-        if trade_sides == "long" and direction == "buy":
-            return True
-        if trade_sides == "short" and direction == "sell":
-            return True
-        return False
-
     def _reset_daily_counters(self, today: date) -> None:
         if self.last_trade_day != today:
             self.last_trade_day = today
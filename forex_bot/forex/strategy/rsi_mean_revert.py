@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Deque, Optional
 
 import numpy as np
@@ -14,11 +15,10 @@ from forex.utils.types import Price
 def rsi(values: list[float], period: int = 14) -> Optional[float]:
     if len(values) < period + 1:
         return None
-    deltas = np.diff(values)
-    ups = np.clip(deltas, 0, None)
-    downs = np.clip(-deltas, 0, None)
-    roll_up = np.mean(ups[-period:])
-    roll_down = np.mean(downs[-period:])
+    # Only the last ``period`` changes feed the averages.
+    deltas = np.diff(values[-(period + 1) :])
+    roll_up = np.maximum(deltas, 0.0).mean()
+    roll_down = -np.minimum(deltas, 0.0).mean()
     if roll_down == 0:
         return 100.0
     rs = roll_up / roll_down
@@ -52,7 +52,12 @@ class RSIMeanRevertStrategy(Strategy):
         self.prices.append(price.mid)
 
     def on_bar_close(self, price: Price) -> None:
-        prices_list = list(self.prices)
+        count = len(self.prices)
+        if count < self.config.period + 1:
+            return
+        # Both indicators only read their own tail, so copy just the longest one.
+        lookback = max(self.config.period, self.config.atr_period) + 1
+        prices_list = list(islice(self.prices, max(count - lookback, 0), None))
         value = rsi(prices_list, self.config.period)
         if value is None:
             return
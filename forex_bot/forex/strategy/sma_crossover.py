@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Deque, Optional
 
 from forex.strategy.base import Signal, Strategy, StrategyContext
@@ -22,28 +24,51 @@ class SMACrossoverStrategy(Strategy):
         self.config = config or SMACrossoverConfig()
         self.context: StrategyContext | None = None
         self.prices: Deque[float] = deque(maxlen=self.config.slow)
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+        self._ticks_since_resync = 0
         self.last_signal: Optional[Signal] = None
 
-    def _sma(self, window: int) -> Optional[float]:
-        if len(self.prices) < window:
-            return None
-        return sum(list(self.prices)[-window:]) / window
-
     def on_startup(self, context: StrategyContext) -> None:
         self.context = context
         self.prices.clear()
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+        self._ticks_since_resync = 0
         self.last_signal = None
 
     def on_price_tick(self, price: Price) -> None:
-        self.prices.append(price.mid)
+        # Running window sums: drop the price leaving each window, add the new one.
+        mid = price.mid
+        prices = self.prices
+        if len(prices) >= self.config.fast:
+            self._fast_sum -= prices[-self.config.fast]
+        if len(prices) == prices.maxlen:
+            self._slow_sum -= prices[0]
+        prices.append(mid)
+        self._fast_sum += mid
+        self._slow_sum += mid
+        # Add/subtract accumulators drift over a long session; rebuild them
+        # exactly once per slow window so the error cannot build up.
+        self._ticks_since_resync += 1
+        if self._ticks_since_resync >= self.config.slow:
+            self._resync_sums()
+
+    def _resync_sums(self) -> None:
+        prices = self.prices
+        fast_start = max(len(prices) - self.config.fast, 0)
+        self._fast_sum = math.fsum(islice(prices, fast_start, None))
+        self._slow_sum = math.fsum(prices)
+        self._ticks_since_resync = 0
 
     def on_bar_close(self, price: Price) -> None:
         if price.spread > self.config.spread_threshold:
             return
-        fast = self._sma(self.config.fast)
-        slow = self._sma(self.config.slow)
-        if fast is None or slow is None:
+        count = len(self.prices)
+        if count < self.config.fast or count < self.config.slow:
             return
+        fast = self._fast_sum / self.config.fast
+        slow = self._slow_sum / self.config.slow
         if fast > slow and (not self.last_signal or self.last_signal.side != "buy"):
             self.last_signal = Signal("buy", fast - slow, "fast_above_slow")
         elif fast < slow and (not self.last_signal or self.last_signal.side != "sell"):
@@ -51,6 +76,9 @@ class SMACrossoverStrategy(Strategy):
 
     def on_stop(self) -> None:
         self.prices.clear()
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+        self._ticks_since_resync = 0
 
     def get_signal(self) -> Optional[Signal]:
         return self.last_signal
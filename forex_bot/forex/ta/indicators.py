@@ -22,13 +22,17 @@ class SMAState:
 class EMAState:
     period: int
     value: float | None = None
+    alpha: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.alpha = 2 / (self.period + 1)
 
     def update(self, price: float) -> float:
-        alpha = 2 / (self.period + 1)
-        if self.value is None:
+        value = self.value
+        if value is None:
             self.value = price
         else:
-            self.value = (price - self.value) * alpha + self.value
+            self.value = (price - value) * self.alpha + value
         return self.value
 
 
@@ -55,8 +59,6 @@ class RSIState:
         self.last_price = price
         if self.avg_loss == 0:
             return 100.0
-        if self.avg_gain is None or self.avg_loss is None:
-            return None
         rs = self.avg_gain / self.avg_loss
         return 100 - (100 / (1 + rs))
 
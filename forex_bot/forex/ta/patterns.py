@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, Union
+
+import numpy as np
 
 
 @dataclass(slots=True)
@@ -28,9 +30,22 @@ class PatternMatch:
     confidence: float
 
 
-def _as_candles(bars: Iterable[dict]) -> list[Candle]:
+# Most bars any pattern looks at (morning/evening star).
+MAX_LOOKBACK = 3
+
+# Bars may be OHLCV dicts, already-built candles, or an ``(n, 5)`` array
+# with open, high, low, close and volume columns.
+Bars = Union[Sequence[dict], Sequence[Candle], np.ndarray]
+
+
+def _as_candles(bars: Bars) -> list[Candle]:
+    if isinstance(bars, np.ndarray):
+        return [Candle(*row) for row in bars.tolist()]
     candles: list[Candle] = []
     for bar in bars:
+        if isinstance(bar, Candle):
+            candles.append(bar)
+            continue
         candles.append(
             Candle(
                 open=float(bar["open"]),
@@ -43,7 +58,7 @@ def _as_candles(bars: Iterable[dict]) -> list[Candle]:
     return candles
 
 
-def engulfing(bars: Sequence[dict]) -> PatternMatch | None:
+def engulfing(bars: Bars) -> PatternMatch | None:
     candles = _as_candles(bars[-2:])
     if len(candles) < 2:
         return None
@@ -57,7 +72,7 @@ def engulfing(bars: Sequence[dict]) -> PatternMatch | None:
     return PatternMatch(name="engulfing", direction=direction, confidence=min(confidence / 3, 1.0))
 
 
-def hammer(bars: Sequence[dict]) -> PatternMatch | None:
+def hammer(bars: Bars) -> PatternMatch | None:
     candle = _as_candles(bars[-1:])
     if not candle:
         return None
@@ -69,7 +84,7 @@ def hammer(bars: Sequence[dict]) -> PatternMatch | None:
     return PatternMatch(name="hammer", direction="bull", confidence=0.6)
 
 
-def shooting_star(bars: Sequence[dict]) -> PatternMatch | None:
+def shooting_star(bars: Bars) -> PatternMatch | None:
     candle = _as_candles(bars[-1:])
     if not candle:
         return None
@@ -84,7 +99,7 @@ def shooting_star(bars: Sequence[dict]) -> PatternMatch | None:
     return PatternMatch(name="shooting_star", direction="bear", confidence=0.6)
 
 
-def doji(bars: Sequence[dict], tolerance: float = 0.1) -> PatternMatch | None:
+def doji(bars: Bars, tolerance: float = 0.1) -> PatternMatch | None:
     candle = _as_candles(bars[-1:])
     if not candle:
         return None
@@ -94,7 +109,7 @@ def doji(bars: Sequence[dict], tolerance: float = 0.1) -> PatternMatch | None:
     return PatternMatch(name="doji", direction="neutral", confidence=0.4)
 
 
-def harami(bars: Sequence[dict]) -> PatternMatch | None:
+def harami(bars: Bars) -> PatternMatch | None:
     candles = _as_candles(bars[-2:])
     if len(candles) < 2:
         return None
@@ -108,7 +123,7 @@ def harami(bars: Sequence[dict]) -> PatternMatch | None:
     return PatternMatch(name="harami", direction=prev.direction, confidence=0.5)
 
 
-def morning_star(bars: Sequence[dict]) -> PatternMatch | None:
+def morning_star(bars: Bars) -> PatternMatch | None:
     candles = _as_candles(bars[-3:])
     if len(candles) < 3:
         return None
@@ -122,7 +137,7 @@ def morning_star(bars: Sequence[dict]) -> PatternMatch | None:
     return PatternMatch(name="morning_star", direction="bull", confidence=0.7)
 
 
-def evening_star(bars: Sequence[dict]) -> PatternMatch | None:
+def evening_star(bars: Bars) -> PatternMatch | None:
     candles = _as_candles(bars[-3:])
     if len(candles) < 3:
         return None
@@ -136,7 +151,7 @@ def evening_star(bars: Sequence[dict]) -> PatternMatch | None:
     return PatternMatch(name="evening_star", direction="bear", confidence=0.7)
 
 
-def pin_bar(bars: Sequence[dict]) -> PatternMatch | None:
+def pin_bar(bars: Bars) -> PatternMatch | None:
     candle = _as_candles(bars[-1:])
     if not candle:
         return None
@@ -165,20 +180,24 @@ PATTERN_FUNCTIONS = {
 }
 
 
-def detect_patterns(bars: Sequence[dict], enabled: Iterable[str]) -> list[PatternMatch]:
+def detect_patterns(bars: Bars, enabled: Iterable[str]) -> list[PatternMatch]:
+    # Convert the tail once; every pattern then slices ready-made candles.
+    candles = _as_candles(bars[-MAX_LOOKBACK:])
     matches: list[PatternMatch] = []
     for name in enabled:
         func = PATTERN_FUNCTIONS.get(name)
         if not func:
             continue
-        match = func(bars)
+        match = func(candles)
         if match:
             matches.append(match)
     return matches
 
 
 __all__ = [
+    "Bars",
     "Candle",
+    "MAX_LOOKBACK",
     "PatternMatch",
     "PATTERN_FUNCTIONS",
     "detect_patterns",
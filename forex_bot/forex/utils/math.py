@@ -35,13 +35,14 @@ def units_for_risk(
 
 
 def atr(values: Iterable[float], period: int) -> float:
-    arr = np.array(list(values), dtype=float)
+    arr = np.fromiter(values, dtype=float)
     if len(arr) < period:
         msg = "Not enough data for ATR"
         raise ValueError(msg)
-    diffs = np.abs(np.diff(arr))
-    atr_values = np.convolve(diffs, np.ones(period), "valid") / period
-    return float(atr_values[-1])
+    # Only the latest window is returned, so reduce over the tail instead of
+    # convolving the whole history.
+    diffs = np.abs(np.diff(arr[-period - 1 :]))
+    return float(diffs.sum()) / period
 
 
 @dataclass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import pendulum
 
@@ -13,15 +14,18 @@ def utc_now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+@lru_cache(maxsize=None)
+def _timezone(name: str) -> pendulum.Timezone:
+    return pendulum.timezone(name)
+
+
 def to_timezone(dt: datetime, tz: str | None = None) -> datetime:
     """Convert a datetime to configured timezone."""
 
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    settings = get_settings()
-    target_tz = pendulum.timezone(tz or settings.default_timezone)
-    pendulum_dt = pendulum.instance(dt)
-    return pendulum_dt.in_timezone(target_tz.name)
+    target_tz = _timezone(tz or get_settings().default_timezone)
+    return pendulum.instance(dt).in_timezone(target_tz)
 
 
 __all__ = ["utc_now", "to_timezone"]
@@ -0,0 +1,33 @@
+"""Numba-compiled candle kernel used when ``FAST_MATH`` is enabled.
+
+Importing numba and compiling the kernel costs noticeable start-up time, so
+this module is only imported on demand by :mod:`forex_app.data`. The
+compiled kernel is cached on disk next to this module, so only the first
+process pays for compilation.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def candle_path(
+    base_price: float, changes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    steps = changes.shape[0]
+    opens = np.empty(steps)
+    highs = np.empty(steps)
+    lows = np.empty(steps)
+    closes = np.empty(steps)
+    price = base_price
+    for index in range(steps):
+        change = changes[index]
+        half_spread = abs(change) * 0.5
+        close = max(0.0001, price * (1 + change))
+        opens[index] = price
+        highs[index] = max(price, close) * (1 + half_spread)
+        lows[index] = min(price, close) * (1 - half_spread)
+        closes[index] = close
+        price = close
+    return opens, highs, lows, closes
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 from .models import Position, PositionStatus, SignalDirection
 
@@ -78,12 +78,15 @@ class PaperBroker(Broker):
 
     def __init__(self) -> None:
         self.account = AccountState()
+        # Open positions only; closing moves a record to closed_positions so
+        # the per-tick mark-to-market and listings never walk history.
         self.positions: dict[str, BrokerPosition] = {}
+        self.closed_positions: list[BrokerPosition] = []
         self.pending_orders: list[dict] = []
 
     async def place_order(self, intent) -> Position:
         position_id = uuid.uuid4().hex
-        opened_at = datetime.utcnow()
+        opened_at = datetime.now(timezone.utc)
         position = BrokerPosition(
             id=position_id,
             instrument=intent.instrument,
@@ -101,14 +104,15 @@ class PaperBroker(Broker):
         return position.to_model()
 
     async def close_position(self, position_id: str, reason: str) -> Position:
-        position = self.positions.get(position_id)
+        position = self.positions.pop(position_id, None)
         if not position:
             raise BrokerError(f"Unknown position {position_id}")
+        self.closed_positions.append(position)
         position.status = PositionStatus.CLOSED
         position.reason = reason
         position.realized_pnl += position.unrealized_pnl
         position.unrealized_pnl = 0.0
-        position.closed_at = datetime.utcnow()
+        position.closed_at = datetime.now(timezone.utc)
         self.account.balance += position.realized_pnl
         self.account.equity = self.account.balance
         self.account.margin_used = max(0.0, self.account.margin_used - abs(position.units) * position.entry_price * 0.02)
@@ -116,14 +120,14 @@ class PaperBroker(Broker):
         return position.to_model()
 
     async def list_open_positions(self) -> list[Position]:
-        return [pos.to_model() for pos in self.positions.values() if pos.status == PositionStatus.OPEN]
+        return [pos.to_model() for pos in self.positions.values()]
 
     async def account_summary(self) -> AccountState:
         return self.account
 
     async def refresh_mark_to_market(self, instrument: str, price: float) -> None:
         for position in self.positions.values():
-            if position.instrument != instrument or position.status != PositionStatus.OPEN:
+            if position.instrument != instrument:
                 continue
             direction = 1 if position.side == SignalDirection.LONG else -1
             move = (price - position.entry_price) * direction
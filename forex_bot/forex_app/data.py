@@ -1,20 +1,44 @@
 """Market data ingestion and feature engineering utilities."""
 from __future__ import annotations
 
+import logging
+import threading
 from collections import deque
-from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Deque, Iterable
+from typing import ContextManager, Deque, Iterable, Iterator
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import Column, DateTime, Float, Integer, MetaData, String, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    and_,
+    create_engine,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from .models import Candle, FeatureSnapshot
 
+LOGGER = logging.getLogger(__name__)
+
 WINDOW_LIMIT = 500
+# ``DB_PATH`` value selecting a private in-memory database (handy for tests).
+MEMORY_DB = ":memory:"
+EMA_SPANS = (8, 21)
+_EMA_ALPHAS = tuple(2.0 / (span + 1) for span in EMA_SPANS)
 
 metadata = MetaData()
 Base = declarative_base(metadata=metadata)
@@ -35,54 +59,133 @@ class CandleORM(Base):
 
 @dataclass(slots=True)
 class FeatureWindow:
-    """In-memory window of candle closes for technical analysis."""
+    """In-memory window of candle closes for technical analysis.
+
+    Alongside the candle deque the window keeps OHLCV columns in a mirrored
+    ring buffer: every value is written at ``i`` and ``i + limit`` so the
+    live window is always one contiguous slice, exposed as NumPy views
+    without copying or re-reading candle attributes.
+    """
 
     candles: Deque[Candle]
+    limit: int = WINDOW_LIMIT
+    _ohlcv: np.ndarray = field(init=False, repr=False)
+    _next: int = field(init=False, default=0, repr=False)
+    _size: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        self._ohlcv = np.empty((5, 2 * self.limit), dtype=np.float64)
+        for candle in list(self.candles)[-self.limit :]:
+            self._push(candle)
 
     def append(self, candle: Candle) -> None:
         self.candles.append(candle)
-        if len(self.candles) > WINDOW_LIMIT:
+        if len(self.candles) > self.limit:
             self.candles.popleft()
+        self._push(candle)
+
+    def _push(self, candle: Candle) -> None:
+        index = self._next
+        column = (candle.open, candle.high, candle.low, candle.close, candle.volume)
+        self._ohlcv[:, index] = column
+        self._ohlcv[:, index + self.limit] = column
+        self._next = (index + 1) % self.limit
+        self._size = min(self._size + 1, self.limit)
+
+    def columns(self) -> np.ndarray:
+        """Return a ``(5, n)`` view of open, high, low, close and volume, oldest first."""
+
+        start = (self._next - self._size) % self.limit
+        return self._ohlcv[:, start : start + self._size]
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self.columns()[3]
 
     def to_dataframe(self) -> pd.DataFrame:
+        opens, highs, lows, closes, volumes = self.columns()
         data = {
             "timestamp": [c.timestamp for c in self.candles],
-            "open": [c.open for c in self.candles],
-            "high": [c.high for c in self.candles],
-            "low": [c.low for c in self.candles],
-            "close": [c.close for c in self.candles],
-            "volume": [c.volume for c in self.candles],
+            "open": opens,
+            "high": highs,
+            "low": lows,
+            "close": closes,
+            "volume": volumes,
         }
         return pd.DataFrame(data).set_index("timestamp")
 
 
 class CandleStore:
-    """Persist candles to SQLite and maintain an in-memory feature window."""
+    """Persist candles to SQLite and maintain per-instrument feature windows.
+
+    ``path`` may be :data:`MEMORY_DB` for a database that lives only as long
+    as the store. That database sits on a single shared connection, so its
+    sessions are serialised with a lock.
+    """
 
-    def __init__(self, path: Path) -> None:
-        self.engine = create_engine(f"sqlite:///{path}", future=True)
+    def __init__(self, path: Path | str) -> None:
+        self._lock: ContextManager[object]
+        if str(path) == MEMORY_DB:
+            # One shared connection: every session (including the flush
+            # thread's) must see the same in-memory database, and must not
+            # interleave with another thread's transaction on it.
+            self.engine = create_engine(
+                "sqlite://",
+                future=True,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+            self._lock = threading.Lock()
+        else:
+            self.engine = create_engine(f"sqlite:///{path}", future=True)
+            self._lock = nullcontext()
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
-        self.window = FeatureWindow(deque(maxlen=WINDOW_LIMIT))
+        self.windows: dict[str, FeatureWindow] = {}
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        with self._lock, self.Session() as session:
+            yield session
+
+    def window_for(self, instrument: str) -> FeatureWindow:
+        window = self.windows.get(instrument)
+        if window is None:
+            window = self.windows[instrument] = FeatureWindow(deque(maxlen=WINDOW_LIMIT))
+        return window
 
     def add(self, candle: Candle) -> None:
-        with self.Session() as session:
-            session.merge(
-                CandleORM(
-                    instrument=candle.instrument,
-                    timestamp=candle.timestamp,
-                    open=candle.open,
-                    high=candle.high,
-                    low=candle.low,
-                    close=candle.close,
-                    volume=candle.volume,
-                )
-            )
+        self.persist_many([candle])
+        self.window_for(candle.instrument).append(candle)
+
+    def persist_many(self, candles: Iterable[Candle]) -> None:
+        """Insert candles in one transaction without touching the feature windows."""
+
+        rows = [
+            {
+                "instrument": candle.instrument,
+                "timestamp": candle.timestamp,
+                "open": candle.open,
+                "high": candle.high,
+                "low": candle.low,
+                "close": candle.close,
+                "volume": candle.volume,
+            }
+            for candle in candles
+        ]
+        if not rows:
+            return
+        with self._session() as session:
+            session.execute(insert(CandleORM), rows)
             session.commit()
-        self.window.append(candle)
 
     def list(self, instrument: str, limit: int = 200) -> list[Candle]:
-        with self.Session() as session:
+        # The live window is at least as fresh as the table (writes are
+        # buffered), so serve from it whenever it holds enough candles.
+        window = self.windows.get(instrument)
+        if window is not None and len(window.candles) >= limit:
+            return list(islice(window.candles, len(window.candles) - limit, None))
+        with self._session() as session:
             rows: list[CandleORM] = (
                 session.query(CandleORM)
                 .filter(CandleORM.instrument == instrument)
@@ -90,73 +193,190 @@ class CandleStore:
                 .limit(limit)
                 .all()
             )
-        candles = [
-            Candle(
-                instrument=row.instrument,
-                timestamp=row.timestamp,
-                open=row.open,
-                high=row.high,
-                low=row.low,
-                close=row.close,
-                volume=row.volume,
-            )
-            for row in reversed(rows)
-        ]
-        return candles
+        return [_to_candle(row) for row in reversed(rows)]
 
     def latest(self, instrument: str) -> Candle | None:
+        window = self.windows.get(instrument)
+        if window is not None and window.candles:
+            return window.candles[-1]
         data = self.list(instrument=instrument, limit=1)
         return data[-1] if data else None
 
+    def latest_many(self, instruments: Iterable[str]) -> dict[str, Candle]:
+        """Return the newest candle per instrument.
+
+        Instruments with a live window are answered from memory; the rest
+        share a single query.
+        """
+
+        latest: dict[str, Candle] = {}
+        names = []
+        for name in dict.fromkeys(instruments):
+            window = self.windows.get(name)
+            if window is not None and window.candles:
+                latest[name] = window.candles[-1]
+            else:
+                names.append(name)
+        if not names:
+            return latest
+        newest = (
+            select(CandleORM.instrument, func.max(CandleORM.timestamp).label("timestamp"))
+            .where(CandleORM.instrument.in_(names))
+            .group_by(CandleORM.instrument)
+            .subquery()
+        )
+        stmt = select(CandleORM).join(
+            newest,
+            and_(
+                CandleORM.instrument == newest.c.instrument,
+                CandleORM.timestamp == newest.c.timestamp,
+            ),
+        )
+        with self._session() as session:
+            rows = session.scalars(stmt).all()
+        latest.update((row.instrument, _to_candle(row)) for row in rows)
+        return latest
+
+
+def _to_candle(row: CandleORM) -> Candle:
+    return Candle(
+        instrument=row.instrument,
+        timestamp=row.timestamp,
+        open=row.open,
+        high=row.high,
+        low=row.low,
+        close=row.close,
+        volume=row.volume,
+    )
+
 
 class FeatureCalculator:
-    """Compute technical indicators required by the RL policy."""
+    """Compute technical indicators required by the RL policy.
+
+    Works directly on the window's NumPy columns; only the last value of
+    each indicator is needed, so every statistic is reduced over the tail
+    of the window rather than materialised as a full series.
+
+    The EMAs are carried forward online: when exactly one candle has been
+    appended since the previous call they advance by one recurrence step,
+    and are only rebuilt from the whole window on the first call or after
+    a gap. Once the window is full the rebuilt value drops the seed that
+    slid out, which differs from the running value by ``(1 - alpha) **
+    WINDOW_LIMIT`` -- far below float precision.
+    """
 
     def __init__(self, window: FeatureWindow) -> None:
         self.window = window
+        self._last_ts: datetime | None = None
+        self._emas: tuple[float, float] | None = None
+        self._snapshot: FeatureSnapshot | None = None
 
     def compute(self) -> FeatureSnapshot | None:
-        if len(self.window.candles) < 20:
+        candles = self.window.candles
+        if len(candles) < 20:
             return None
-        df = self.window.to_dataframe()
-        closes = df["close"]
-        ema_fast = closes.ewm(span=8, adjust=False).mean().iloc[-1]
-        ema_slow = closes.ewm(span=21, adjust=False).mean().iloc[-1]
-        delta = closes.diff().dropna()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-        avg_gain = gain.rolling(window=14).mean().iloc[-1]
-        avg_loss = loss.rolling(window=14).mean().iloc[-1]
+        latest_ts = candles[-1].timestamp
+        if latest_ts == self._last_ts:
+            return self._snapshot
+        _, highs, lows, closes, _ = self.window.columns()
+        if self._emas is not None and candles[-2].timestamp == self._last_ts:
+            close = float(closes[-1])
+            (fast, slow), (fast_alpha, slow_alpha) = self._emas, _EMA_ALPHAS
+            ema_fast = fast + fast_alpha * (close - fast)
+            ema_slow = slow + slow_alpha * (close - slow)
+        else:
+            # Both EMAs come out of a single matrix-vector product.
+            ema_fast, ema_slow = (_ema_weights(EMA_SPANS, len(closes)) @ closes).tolist()
+        self._emas = (ema_fast, ema_slow)
+        self._last_ts = latest_ts
+        self._snapshot = self._snapshot_for(highs, lows, closes, ema_fast, ema_slow)
+        return self._snapshot
+
+    def _snapshot_for(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        ema_fast: float,
+        ema_slow: float,
+    ) -> FeatureSnapshot | None:
+        delta = np.diff(closes[-15:])
+        avg_gain = np.clip(delta, 0.0, None).mean()
+        avg_loss = -np.clip(delta, None, 0.0).mean()
         rs = np.inf if avg_loss == 0 else avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
-        atr = self._atr(df)
+        atr = self._atr(highs, lows, closes)
         if np.isnan(atr):
             return None
-        returns = closes.pct_change().iloc[-1]
+        returns = closes[-1] / closes[-2] - 1
+        # Validation already coerces NumPy scalars (float subclasses) to
+        # plain floats, so no float() round-trips here.
         return FeatureSnapshot(
-            ema_fast=float(ema_fast),
-            ema_slow=float(ema_slow),
-            rsi=float(rsi),
-            atr=float(atr),
-            returns=float(returns),
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
+            rsi=rsi,
+            atr=atr,
+            returns=returns,
         )
 
     @staticmethod
-    def _atr(df: pd.DataFrame, period: int = 14) -> float:
-        high = df["high"]
-        low = df["low"]
-        close = df["close"]
-        prev_close = close.shift(1)
-        tr = pd.concat(
-            [
-                (high - low),
-                (high - prev_close).abs(),
-                (low - prev_close).abs(),
-            ],
-            axis=1,
-        ).max(axis=1)
-        atr = tr.rolling(window=period).mean().iloc[-1]
-        return float(atr)
+    def _atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> float:
+        high = highs[-period:]
+        low = lows[-period:]
+        prev_close = closes[-period - 1 : -1]
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        return tr.mean()
+
+
+@lru_cache(maxsize=4)
+def _ema_weights(spans: tuple[int, ...], length: int) -> np.ndarray:
+    """Per-span weights turning a dot product into ``ewm(span, adjust=False)``'s last value.
+
+    One row per span. The window length only changes while a window fills
+    up, so the matrix is built once and reused on every later tick.
+    """
+
+    weights = np.empty((len(spans), length), dtype=np.float64)
+    powers = np.arange(length - 1, -1, -1, dtype=np.float64)
+    for row, span in zip(weights, spans):
+        alpha = 2.0 / (span + 1)
+        row[:] = alpha * (1 - alpha) ** powers
+        # The seed observation carries the remaining weight (1 - alpha) ** (n - 1).
+        row[0] /= alpha
+    weights.setflags(write=False)
+    return weights
+
+
+def _candle_path(
+    base_price: float, changes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return open, high, low and close arrays for a random walk of ``changes``."""
+
+    closes = base_price * np.cumprod(1 + changes)
+    if closes.size and closes.min() < 0.0001:
+        # The price floor makes the walk path-dependent; fall back to the
+        # step-by-step recurrence in the (practically unreachable) case it binds.
+        price = base_price
+        for index, factor in enumerate((1 + changes).tolist()):
+            price = closes[index] = max(0.0001, price * factor)
+    opens = np.concatenate(([base_price], closes[:-1]))
+    spread = np.abs(changes) * 0.5
+    highs = np.maximum(opens, closes) * (1 + spread)
+    lows = np.minimum(opens, closes) * (1 - spread)
+    return opens, highs, lows, closes
+
+
+def _resolve_candle_path(fast_math: bool):
+    """Pick the candle kernel, importing numba only when explicitly requested."""
+
+    if not fast_math:
+        return _candle_path
+    try:
+        from ._candle_math import candle_path
+    except ImportError:
+        LOGGER.warning("numba not available; using NumPy candle math")
+        return _candle_path
+    return candle_path
 
 
 def generate_synthetic_candles(
@@ -166,18 +386,21 @@ def generate_synthetic_candles(
     steps: int,
     base_price: float,
     interval: timedelta,
+    seed: int = 42,
+    fast_math: bool = False,
 ) -> Iterable[Candle]:
-    price = base_price
-    rng = np.random.default_rng(seed=42)
-    for index in range(steps):
-        timestamp = start + index * interval
-        change = rng.normal(0, 0.0005)
-        open_price = price
-        close = max(0.0001, price * (1 + change))
-        high = max(open_price, close) * (1 + abs(change) * 0.5)
-        low = min(open_price, close) * (1 - abs(change) * 0.5)
-        volume = float(rng.integers(1000, 5000))
-        price = close
+    # Draw the whole path up front; only the Candle objects are built lazily.
+    rng = np.random.default_rng(seed=seed)
+    changes = rng.normal(0, 0.0005, steps)
+    volumes = rng.integers(1000, 5000, steps).astype(np.float64)
+    opens, highs, lows, closes = _resolve_candle_path(fast_math)(base_price, changes)
+    timestamp = start - interval
+    for open_price, high, low, close, volume in zip(
+        opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist()
+    ):
+        # Running sum: one datetime add per candle instead of a timedelta
+        # multiply followed by an add.
+        timestamp += interval
         yield Candle(
             instrument=instrument,
             timestamp=timestamp,
@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
 import uuid
 from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Deque
 
-from .broker import Broker, PaperBroker
+from .broker import AccountState, Broker, PaperBroker
 from .data import CandleStore, FeatureCalculator, generate_synthetic_candles
-from .event_bus import EventBus
+from .event_bus import EventBus, encode_message
 from .metrics import Counter, Gauge, register
 from .models import (
     Candle,
@@ -28,6 +30,8 @@ from .risk import RiskManager
 from .rl_agent import RLSignalService
 from .settings import Settings
 
+LOGGER = logging.getLogger(__name__)
+
 STAGES = ["data", "features", "rl", "risk", "order", "broker", "position", "pnl", "news"]
 
 METRIC_TRADE_COUNT = register(Counter("trades_total", "Total trades executed", ["mode"]))
@@ -35,6 +39,9 @@ METRIC_REJECT_COUNT = register(Counter("trade_rejections_total", "Rejected trade
 METRIC_HEARTBEAT = register(Gauge("engine_heartbeat", "Engine heartbeat timestamp"))
 METRIC_EQUITY = register(Gauge("equity", "Account equity"))
 
+WRITE_FLUSH_INTERVAL_SECONDS = 0.1
+MAX_CATCHUP_INTERVALS = 10
+
 
 @dataclass(slots=True)
 class EngineContext:
@@ -43,6 +50,16 @@ class EngineContext:
     mode: str
 
 
+@dataclass(slots=True)
+class StageState:
+    """Mutable per-stage state; converted to EngineStageStatus only by status()."""
+
+    stage: str
+    status: str = "idle"
+    reason: str | None = None
+    last_event_ts: datetime | None = None
+
+
 class TradingEngine:
     def __init__(
         self,
@@ -60,70 +77,179 @@ class TradingEngine:
         self.news_service = news_service
         self.risk = RiskManager(settings)
         self.rl_service = RLSignalService(settings)
-        self.feature_calc = FeatureCalculator(self.candle_store.window)
-        self.stages: dict[str, EngineStageStatus] = {
-            stage: EngineStageStatus(stage=stage) for stage in STAGES
-        }
+        self._feature_calcs: dict[str, FeatureCalculator] = {}
+        self.stages: dict[str, StageState] = {stage: StageState(stage=stage) for stage in STAGES}
         self.run_id: str | None = None
         self.context: EngineContext | None = None
+        self.contexts: list[EngineContext] = []
         self.last_signal: Signal | None = None
         self.last_features: FeatureSnapshot | None = None
         self._runner_task: asyncio.Task | None = None
         self._news_task: asyncio.Task | None = None
+        self._flush_task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        # Set by stop(), force_signal() and tick_now() to cut the inter-tick
+        # sleep short.
+        self._wake = asyncio.Event()
+        # Set once per processed batch of candles, so callers (and tests) can
+        # wait for the loop to make progress instead of sleeping a fixed time.
+        self.tick_processed = asyncio.Event()
         self._events: Deque[EventEnvelope] = deque(maxlen=200)
         self._idle_reason = "Engine not started"
         self._forced_signal: Signal | None = None
+        # Swapped to _consume_forced_signal by force_signal() so the common
+        # path never checks for a pending manual override.
+        self._decide_signal = self._model_signal
+        # Candles awaiting persistence; ticks only append, _flush_loop writes.
+        self._write_buffer: Deque[Candle] = deque()
+        # Positions opened by this engine and not yet closed; lets idle ticks
+        # skip the broker's mark-to-market and position listing entirely.
+        self._open_positions = 0
+        self._tick_stages: list[dict] | None = None
+        self._tick_events: list[EventEnvelope] | None = None
+        self._tick_ts: datetime | None = None
+        # Resolved once per run so executed orders skip the context lookup.
+        self._trade_counter = METRIC_TRADE_COUNT.labels(mode="paper")
+        # One engine.tick payload per instrument, rebuilt per run and updated
+        # in place each tick; it is encoded to bytes before publishing, so
+        # subscribers never see later mutations.
+        self._tick_payloads: dict[str, dict] = {}
+
+    @property
+    def settings(self) -> Settings:
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: Settings) -> None:
+        # Settings are frozen, so the per-tick thresholds can be unwrapped once
+        # here instead of going through the pydantic model on every signal.
+        self._settings = settings
+        self._min_signal_conf = float(settings.MIN_SIGNAL_CONF)
+        self._use_rl_signals = settings.USE_RL_SIGNALS
+        self._interval_s = float(settings.HEARTBEAT_INTERVAL_SECONDS)
+
+    async def start(
+        self,
+        *,
+        instrument: str,
+        timeframe: str,
+        mode: str,
+        instruments: list[str] | None = None,
+    ) -> str:
+        """Start a run over ``instrument`` plus every entry of ``instruments``.
+
+        ``instrument`` is the primary context and comes first; duplicates are
+        dropped, keeping the first occurrence. All instruments advance in
+        lockstep: one loop iteration produces a candle per instrument,
+        persists them in a single write and then runs each through the
+        pipeline.
+        """
 
-    async def start(self, *, instrument: str, timeframe: str, mode: str) -> str:
         if self._runner_task and not self._runner_task.done():
             raise RuntimeError("Engine already running")
         self.run_id = uuid.uuid4().hex
-        self.context = EngineContext(instrument=instrument, timeframe=timeframe, mode=mode)
+        self.contexts = [
+            EngineContext(instrument=name, timeframe=timeframe, mode=mode)
+            for name in dict.fromkeys([instrument, *(instruments or ())])
+        ]
+        self.context = self.contexts[0]
+        self._trade_counter = METRIC_TRADE_COUNT.labels(mode=mode)
+        self._tick_payloads = {
+            ctx.instrument: self._tick_payload(ctx.instrument) for ctx in self.contexts
+        }
+        self._open_positions = len(await self.broker.list_open_positions())
         self._stop_event.clear()
-        self._runner_task = asyncio.create_task(self._run_loop())
+        self._wake.clear()
+        self.tick_processed.clear()
+        self._runner_task = asyncio.create_task(self._run_loop(self.contexts))
         self._news_task = asyncio.create_task(self._news_loop())
+        self._flush_task = asyncio.create_task(self._flush_loop())
         return self.run_id
 
     async def stop(self) -> None:
         self._stop_event.set()
+        self._wake.set()
         if self._runner_task:
             await self._runner_task
         if self._news_task:
             await self._news_task
+        if self._flush_task:
+            await self._flush_task
+        await self._drain_writes()
         self._runner_task = None
         self._news_task = None
+        self._flush_task = None
         self._idle_reason = "Engine stopped"
 
     async def force_signal(self, signal: Signal) -> None:
         self._forced_signal = signal
-        await self._publish_event(
+        self._decide_signal = self._consume_forced_signal
+        self._wake.set()
+        self._publish_event(
             EventEnvelope(
                 trace_id=uuid.uuid4().hex,
                 stage="rl",
-                ts=datetime.utcnow(),
+                ts=datetime.now(timezone.utc),
                 decision="forced_signal",
                 reason_codes=signal.reason_codes,
                 payload={"direction": signal.direction.value, "confidence": signal.confidence},
             )
         )
 
-    async def _run_loop(self) -> None:
-        assert self.context is not None
+    async def tick_now(self) -> None:
+        """Cut the current inter-tick wait short and await the next processed batch."""
+
+        if not self._runner_task or self._runner_task.done():
+            raise RuntimeError("Engine not running")
+        self.tick_processed.clear()
+        self._wake.set()
+        await self.tick_processed.wait()
+
+    async def _run_loop(self, contexts: list[EngineContext]) -> None:
+        # Contexts are bound by start(), so the loop never sees an unstarted engine.
         interval = timedelta(minutes=1)
-        start = datetime.utcnow() - timedelta(minutes=500)
-        synthetic_stream = generate_synthetic_candles(
-            instrument=self.context.instrument,
-            start=start,
-            steps=10_000,
-            base_price=1.35,
-            interval=interval,
-        )
-        for candle in synthetic_stream:
+        # Candle timestamps stay naive UTC, matching what SQLite hands back.
+        start = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=500)
+        streams = [
+            generate_synthetic_candles(
+                instrument=ctx.instrument,
+                start=start,
+                steps=10_000,
+                base_price=1.35,
+                interval=interval,
+                seed=42 + index,
+                fast_math=self.settings.FAST_MATH,
+            )
+            for index, ctx in enumerate(contexts)
+        ]
+        loop = asyncio.get_running_loop()
+        interval_s = self._interval_s
+        next_deadline = loop.time() + interval_s
+        for candles in zip(*streams):
             if self._stop_event.is_set():
                 break
-            await self._process_candle(candle)
-            await asyncio.sleep(float(self.settings.HEARTBEAT_INTERVAL_SECONDS))
+            await self._process_batch(list(candles))
+            # Sleep to a fixed deadline so tick runtime does not stretch the
+            # cadence; after a long stall, resync rather than burst-catch-up.
+            now = loop.time()
+            if now > next_deadline + MAX_CATCHUP_INTERVALS * interval_s:
+                next_deadline = now + interval_s
+            delay = next_deadline - now
+            if delay > 0 and not self._wake.is_set():
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                # Catching up or woken: the pipeline may never suspend, so
+                # yield once to let handlers and the flush task run.
+                await asyncio.sleep(0)
+            if self._wake.is_set():
+                # Stopped or handed a forced signal: act on it now and
+                # restart the cadence from here.
+                self._wake.clear()
+                next_deadline = loop.time()
+            next_deadline += interval_s
         self._idle_reason = "Stream completed"
 
     async def _news_loop(self) -> None:
@@ -131,12 +257,12 @@ class TradingEngine:
             try:
                 news_items = await self.news_service.fetch_news()
             except Exception as exc:  # pragma: no cover - network errors
-                await self._transition("news", "error", reason="fetch_failed")
-                await self._publish_event(
+                self._transition("news", "error", reason="fetch_failed")
+                self._publish_event(
                     EventEnvelope(
                         trace_id=uuid.uuid4().hex,
                         stage="news",
-                        ts=datetime.utcnow(),
+                        ts=datetime.now(timezone.utc),
                         decision="error",
                         reason_codes=["news_fetch_failed"],
                         payload={"error": str(exc)},
@@ -144,13 +270,13 @@ class TradingEngine:
                 )
             else:
                 if news_items:
-                    await self._transition("news", "ok")
+                    self._transition("news", "ok")
                     latest = news_items[0]
-                    await self._publish_event(
+                    self._publish_event(
                         EventEnvelope(
                             trace_id=uuid.uuid4().hex,
                             stage="news",
-                            ts=datetime.utcnow(),
+                            ts=datetime.now(timezone.utc),
                             decision="fetched",
                             reason_codes=[],
                             payload={"title": latest.title, "sentiment": latest.sentiment},
@@ -162,34 +288,91 @@ class TradingEngine:
                 continue
 
     async def _process_candle(self, candle: Candle) -> None:
-        now = datetime.utcnow()
-        METRIC_HEARTBEAT.set(now.timestamp())
-        await self._transition("data", "ok", reason="tick")
-        self.candle_store.add(candle)
-        self.risk.update_equity((await self.broker.account_summary()).equity)
-        features = self.feature_calc.compute()
+        await self._process_batch([candle])
+
+    async def _process_batch(self, candles: list[Candle]) -> None:
+        """Ingest one candle per instrument, persist them together, then tick each."""
+
+        for candle in candles:
+            self.candle_store.window_for(candle.instrument).append(candle)
+        self._write_buffer.extend(candles)
+        for candle in candles:
+            await self._tick(candle)
+        self.tick_processed.set()
+
+    def _features_for(self, instrument: str) -> FeatureCalculator:
+        calc = self._feature_calcs.get(instrument)
+        if calc is None:
+            calc = FeatureCalculator(self.candle_store.window_for(instrument))
+            self._feature_calcs[instrument] = calc
+        return calc
+
+    async def _tick(self, candle: Candle) -> None:
+        # One clock read per tick; every stage transition in the tick shares it.
+        tick_ns = time.time_ns()
+        self._tick_ts = datetime.fromtimestamp(tick_ns / 1e9, tz=timezone.utc)
+        self._tick_stages = []
+        self._tick_events = []
+        try:
+            await self._run_pipeline(candle, tick_ns)
+        finally:
+            stages, self._tick_stages = self._tick_stages, None
+            events, self._tick_events = self._tick_events, None
+            self._tick_ts = None
+            if self.event_bus.has_subscribers("events"):
+                payload = self._tick_payloads.get(candle.instrument)
+                if payload is None:
+                    payload = self._tick_payloads[candle.instrument] = self._tick_payload(
+                        candle.instrument
+                    )
+                payload["close"] = candle.close
+                payload["timestamp_ns"] = tick_ns
+                payload["stages"] = stages
+                payload["events"] = [event.model_dump() for event in events]
+                # Encoded once here; every SSE stream shares the bytes.
+                self.event_bus.publish_bytes("events", encode_message(payload))
+
+    def _tick_payload(self, instrument: str) -> dict:
+        return {
+            "type": "engine.tick",
+            "run_id": self.run_id,
+            "instrument": instrument,
+            "close": None,
+            "timestamp_ns": None,
+            "stages": None,
+            "events": None,
+        }
+
+    async def _run_pipeline(self, candle: Candle, tick_ns: int) -> None:
+        METRIC_HEARTBEAT.set(tick_ns / 1e9)
+        self._transition("data", "ok", reason="tick")
+        # One account read per tick; nothing in the pipeline before an order
+        # is placed can move equity, so the risk check and the flat-book
+        # equity gauge reuse it.
+        account = await self.broker.account_summary()
+        self.risk.update_equity(account.equity)
+        features = self._features_for(candle.instrument).compute()
         if not features:
             self._idle_reason = "Awaiting feature warmup"
-            await self._transition("features", "blocked", reason="insufficient_history")
+            self._transition("features", "blocked", reason="insufficient_history")
             return
         self.last_features = features
-        await self._transition("features", "ok")
-        signal = await self._signal_decision(features)
+        self._transition("features", "ok")
+        signal = self._decide_signal(features)
         self.last_signal = signal
-        if signal.direction == SignalDirection.FLAT or signal.confidence < float(self.settings.MIN_SIGNAL_CONF):
+        if signal.direction == SignalDirection.FLAT or signal.confidence < self._min_signal_conf:
             reason = "low_confidence" if signal.direction != SignalDirection.FLAT else "flat_signal"
             self._idle_reason = "No actionable signal"
             METRIC_REJECT_COUNT.labels(reason=reason).inc()
-            await self._transition("rl", "blocked", reason=reason)
-            await self._evaluate_positions(candle, signal)
+            self._transition("rl", "blocked", reason=reason)
+            await self._evaluate_positions(candle, signal, account)
             return
-        await self._transition("rl", "ok")
-        account = await self.broker.account_summary()
+        self._transition("rl", "ok")
         if self.risk.max_drawdown_breached(account.equity):
-            await self._transition("risk", "blocked", reason="drawdown_stop")
+            self._transition("risk", "blocked", reason="drawdown_stop")
             self._idle_reason = "Risk throttle active"
             METRIC_REJECT_COUNT.labels(reason="drawdown_stop").inc()
-            await self._evaluate_positions(candle, signal)
+            await self._evaluate_positions(candle, signal, account)
             return
         plan = self.risk.position_plan(
             equity=account.equity,
@@ -198,12 +381,12 @@ class TradingEngine:
             direction=signal.direction,
         )
         if not plan:
-            await self._transition("risk", "blocked", reason="position_sizing")
+            self._transition("risk", "blocked", reason="position_sizing")
             self._idle_reason = "Risk filters blocked trade"
             METRIC_REJECT_COUNT.labels(reason="position_sizing").inc()
-            await self._evaluate_positions(candle, signal)
+            await self._evaluate_positions(candle, signal, account)
             return
-        await self._transition("risk", "ok")
+        self._transition("risk", "ok")
         order = self.risk.build_order_intent(
             plan=plan,
             instrument=candle.instrument,
@@ -211,14 +394,15 @@ class TradingEngine:
             direction=signal.direction,
             reason_codes=signal.reason_codes,
         )
-        await self._transition("order", "ok")
+        self._transition("order", "ok")
         position = await self.broker.place_order(order)
-        await self._transition("broker", "ok")
-        await self._publish_event(
+        self._open_positions += 1
+        self._transition("broker", "ok")
+        self._publish_event(
             EventEnvelope(
                 trace_id=uuid.uuid4().hex,
                 stage="order",
-                ts=datetime.utcnow(),
+                ts=self._tick_ts,
                 decision="executed",
                 reason_codes=order.reason_codes,
                 payload={
@@ -228,36 +412,66 @@ class TradingEngine:
                 },
             )
         )
-        METRIC_TRADE_COUNT.labels(mode=self.context.mode if self.context else "paper").inc()
-        await self._publish_event(
+        self._trade_counter.inc()
+        self._publish_event(
             EventEnvelope(
                 trace_id=uuid.uuid4().hex,
                 stage="position",
-                ts=datetime.utcnow(),
+                ts=self._tick_ts,
                 decision="opened",
                 reason_codes=[],
                 payload={"position_id": position.id, "risk": order.risk_fraction},
             )
         )
         self._idle_reason = "Monitoring open positions"
-        await self._evaluate_positions(candle, signal)
-
-    async def _signal_decision(self, features: FeatureSnapshot) -> Signal:
-        if self._forced_signal:
-            signal = self._forced_signal
-            self._forced_signal = None
-            return signal
-        if not self.settings.USE_RL_SIGNALS:
+        await self._evaluate_positions(candle, signal, account)
+
+    async def _flush_loop(self) -> None:
+        """Persist buffered candles in one batch per flush interval."""
+
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=WRITE_FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            await self._drain_writes()
+
+    async def _drain_writes(self) -> None:
+        if not self._write_buffer:
+            return
+        batch = list(self._write_buffer)
+        self._write_buffer.clear()
+        try:
+            await asyncio.to_thread(self.candle_store.persist_many, batch)
+        except Exception:
+            LOGGER.exception("Candle persistence failed")
+
+    def _model_signal(self, features: FeatureSnapshot) -> Signal:
+        if not self._use_rl_signals:
             return Signal(direction=SignalDirection.FLAT, confidence=0.0, features=features)
-        signal = self.rl_service.predict(features)
-        return signal
+        return self.rl_service.predict(features)
+
+    def _consume_forced_signal(self, features: FeatureSnapshot) -> Signal:
+        signal, self._forced_signal = self._forced_signal, None
+        self._decide_signal = self._model_signal
+        return signal if signal is not None else self._model_signal(features)
 
-    async def _evaluate_positions(self, candle: Candle, signal: Signal) -> None:
+    async def _evaluate_positions(self, candle: Candle, signal: Signal, account: AccountState) -> None:
+        if not self._open_positions:
+            self._transition("pnl", "ok")
+            METRIC_EQUITY.set(account.equity)
+            self._idle_reason = "No open positions"
+            return
         await self.broker.refresh_mark_to_market(candle.instrument, candle.close)
-        await self._transition("pnl", "ok")
+        self._transition("pnl", "ok")
         positions = await self.broker.list_open_positions()
+        self._open_positions = len(positions)
         METRIC_EQUITY.set((await self.broker.account_summary()).equity)
         for position in positions:
+            # The candle and signal belong to one instrument; other positions
+            # are checked when their own instrument's candle arrives.
+            if position.instrument != candle.instrument:
+                continue
             exit_reason = None
             if position.stop_loss and (
                 (position.side == SignalDirection.LONG and candle.low <= position.stop_loss)
@@ -269,58 +483,82 @@ class TradingEngine:
                 or (position.side == SignalDirection.SHORT and candle.low <= position.take_profit)
             ):
                 exit_reason = "take_profit"
-            elif signal.direction != position.side and signal.confidence - float(self.settings.MIN_SIGNAL_CONF) >= 0.3:
+            elif signal.direction != position.side and signal.confidence - self._min_signal_conf >= 0.3:
                 exit_reason = "signal_flip"
             if exit_reason:
                 closed = await self.broker.close_position(position.id, exit_reason)
-                await self._publish_event(
+                self._open_positions -= 1
+                self._publish_event(
                     EventEnvelope(
                         trace_id=uuid.uuid4().hex,
                         stage="position",
-                        ts=datetime.utcnow(),
+                        ts=self._tick_ts,
                         decision="closed",
                         reason_codes=[exit_reason],
                         payload={"position_id": closed.id, "pnl": closed.realized_pnl},
                     )
                 )
-        if positions:
+        if self._open_positions:
             self._idle_reason = "Monitoring open positions"
         else:
             self._idle_reason = "No open positions"
 
     async def status(self) -> EngineStatus:
         account = await self.broker.account_summary()
-        heartbeat = datetime.utcnow()
+        heartbeat = datetime.now(timezone.utc)
         latest_event = self._events[-1].model_dump() if self._events else None
         return EngineStatus(
             run_id=self.run_id,
             mode=self.context.mode if self.context else "paper",
             broker=self.settings.BROKER,
             instrument=self.context.instrument if self.context else None,
+            instruments=[ctx.instrument for ctx in self.contexts],
             heartbeat_ts=heartbeat,
-            stages=list(self.stages.values()),
+            stages=[
+                EngineStageStatus(
+                    stage=entry.stage,
+                    status=entry.status,
+                    reason=entry.reason,
+                    last_event_ts=entry.last_event_ts,
+                )
+                for entry in self.stages.values()
+            ],
             latest_event=latest_event,
             idle_reason=self._idle_reason,
         )
 
-    async def _transition(self, stage: str, status: str, reason: str | None = None) -> None:
+    def _transition(self, stage: str, status: str, reason: str | None = None) -> None:
         entry = self.stages[stage]
-        entry.status = status  # type: ignore[assignment]
+        entry.status = status
         entry.reason = reason
-        entry.last_event_ts = datetime.utcnow()
-        await self.event_bus.publish(
+        if self._tick_stages is not None:
+            # Inside a tick: batched into the engine.tick message, which
+            # carries the shared timestamp_ns.
+            entry.last_event_ts = self._tick_ts
+            self._tick_stages.append({"stage": stage, "status": status, "reason": reason})
+            return
+        entry.last_event_ts = datetime.now(timezone.utc)
+        self.event_bus.publish_nowait(
             "events",
             {
                 "stage": stage,
                 "status": status,
                 "reason": reason,
-                "ts": entry.last_event_ts.isoformat(),
+                # Left as a datetime; the SSE layer formats it on send.
+                "ts": entry.last_event_ts,
             },
         )
 
-    async def _publish_event(self, event: EventEnvelope) -> None:
+    def _publish_event(self, event: EventEnvelope) -> None:
+        # Envelopes are only dumped to dicts once someone is listening; the
+        # ``ts`` datetime stays an object until the SSE layer encodes it.
         self._events.append(event)
-        await self.event_bus.publish("events", event.model_dump())
+        if self._tick_events is not None:
+            # Inside a tick: delivered with the engine.tick message.
+            self._tick_events.append(event)
+            return
+        if self.event_bus.has_subscribers("events"):
+            self.event_bus.publish_nowait("events", event.model_dump())
 
 
 __all__ = ["TradingEngine"]
@@ -2,48 +2,93 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import json
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, DefaultDict
+from datetime import datetime
+from typing import AsyncIterator
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - fallback when package missing
+    orjson = None
+
+
+def _json_default(value: object) -> str:
+    """Format event values that are kept as objects until they reach a client."""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_message(message: dict) -> bytes:
+    """Serialise a bus message to JSON bytes, with orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(message, default=_json_default)
+    return json.dumps(message, default=_json_default).encode()
 
 
 class EventBus:
-    """Asynchronous fan-out for engine events and logs."""
+    """Asynchronous fan-out for engine events and logs.
+
+    Each topic maps to an immutable tuple of subscriber queues. Subscribing
+    and unsubscribing build a new tuple and swap it in, so publishers always
+    read a consistent snapshot. Every method runs synchronously on the event
+    loop thread, where nothing can interleave with the swap, so no lock is
+    needed; call them from that thread only.
+    """
 
     def __init__(self) -> None:
-        self._topics: DefaultDict[str, set[asyncio.Queue]] = defaultdict(set)
-        self._lock = asyncio.Lock()
+        self._topics: dict[str, tuple[asyncio.Queue, ...]] = {}
 
     async def publish(self, topic: str, message: dict) -> None:
         """Publish a message to a topic."""
 
-        async with self._lock:
-            queues = list(self._topics.get(topic, set()))
-        for queue in queues:
-            await queue.put(message)
+        self.publish_nowait(topic, message)
+
+    def publish_nowait(self, topic: str, message: dict) -> None:
+        """Fan a message out without suspending the publisher.
+
+        Subscriber queues are unbounded, so ``put_nowait`` never blocks; the
+        waiting consumers are woken on the next loop iteration.
+        """
+
+        for queue in self._topics.get(topic, ()):
+            queue.put_nowait(message)
+
+    def publish_bytes(self, topic: str, payload: bytes) -> None:
+        """Fan out a message already encoded with :func:`encode_message`.
+
+        Subscribers receive the same ``bytes`` object, so a message is
+        serialised once however many streams are attached.
+        """
+
+        for queue in self._topics.get(topic, ()):
+            queue.put_nowait(payload)
+
+    def has_subscribers(self, topic: str) -> bool:
+        return topic in self._topics
 
-    async def subscribe(self, topic: str) -> asyncio.Queue:
+    def subscribe(self, topic: str) -> asyncio.Queue:
         queue: asyncio.Queue = asyncio.Queue()
-        async with self._lock:
-            self._topics[topic].add(queue)
+        self._topics[topic] = self._topics.get(topic, ()) + (queue,)
         return queue
 
-    async def unsubscribe(self, topic: str, queue: asyncio.Queue) -> None:
-        async with self._lock:
-            queues = self._topics.get(topic)
-            if not queues:
-                return
-            queues.discard(queue)
-            if not queues:
-                self._topics.pop(topic, None)
+    def unsubscribe(self, topic: str, queue: asyncio.Queue) -> None:
+        queues = tuple(q for q in self._topics.get(topic, ()) if q is not queue)
+        if queues:
+            self._topics[topic] = queues
+        else:
+            self._topics.pop(topic, None)
 
     @asynccontextmanager
     async def listener(self, topic: str) -> AsyncIterator[asyncio.Queue]:
-        queue = await self.subscribe(topic)
+        queue = self.subscribe(topic)
         try:
             yield queue
         finally:
-            await self.unsubscribe(topic, queue)
+            self.unsubscribe(topic, queue)
 
 
-__all__ = ["EventBus"]
+__all__ = ["EventBus", "encode_message"]
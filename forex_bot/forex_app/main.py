@@ -1,6 +1,10 @@
 """App entrypoint for uvicorn."""
 from __future__ import annotations
 
-from .routes import app
+from .routes import create_app
+
+# Built here rather than in routes so importing the package (tests, tooling)
+# does not construct a second engine, broker and database connection.
+app = create_app()
 
 __all__ = ["app"]
@@ -8,7 +8,7 @@ from typing import Iterable, Tuple
 CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
 
 
-@dataclass
+@dataclass(slots=True)
 class _ChildMetric:
     registry: "BaseMetric"
     label_values: Tuple[str, ...]
@@ -26,6 +26,7 @@ class BaseMetric:
         self.description = description
         self.labelnames = tuple(labelnames or [])
         self._values: defaultdict[Tuple[str, ...], float] = defaultdict(float)
+        self._children: dict[Tuple[str, ...], _ChildMetric] = {}
 
     def labels(self, *values: str, **kw: str) -> _ChildMetric:
         if values and kw:
@@ -34,9 +35,12 @@ class BaseMetric:
             ordered = tuple(kw[name] for name in self.labelnames)
         else:
             ordered = tuple(values)
-        if len(ordered) != len(self.labelnames):
-            raise ValueError("label count mismatch")
-        return _ChildMetric(self, ordered)
+        child = self._children.get(ordered)
+        if child is None:
+            if len(ordered) != len(self.labelnames):
+                raise ValueError("label count mismatch")
+            child = self._children[ordered] = _ChildMetric(self, ordered)
+        return child
 
     def samples(self) -> list[tuple[Tuple[str, ...], float]]:
         return list(self._values.items())
@@ -115,6 +115,7 @@ class EngineStatus(BaseModel):
     mode: Literal["paper", "live"]
     broker: str
     instrument: str | None = None
+    instruments: list[str] = Field(default_factory=list)
     heartbeat_ts: datetime
     stages: list[EngineStageStatus]
     latest_event: dict[str, str | float | int] | None = None
@@ -6,7 +6,7 @@ import uuid
 from collections import deque
 from datetime import datetime, timedelta
 
-from fastapi import Depends, FastAPI, Request, Response
+from fastapi import Depends, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse, StreamingResponse
 from .metrics import CONTENT_TYPE_LATEST, generate_latest
@@ -14,7 +14,7 @@ from .metrics import CONTENT_TYPE_LATEST, generate_latest
 from .broker import OandaBroker, PaperBroker
 from .data import CandleStore, FeatureCalculator, FeatureWindow, generate_synthetic_candles
 from .engine import TradingEngine
-from .event_bus import EventBus
+from .event_bus import EventBus, encode_message
 from .logging import configure_logging
 from .models import (
     BacktestResult,
@@ -30,10 +30,12 @@ from .risk import RiskManager
 from .rl_agent import RLSignalService
 from .settings import Settings, SettingsUpdate, get_settings, update_settings
 
+MAX_BACKTEST_BARS = 5000
+
 
 def create_app(settings: Settings | None = None) -> FastAPI:
     settings = settings or get_settings()
-    configure_logging()
+    configure_logging(fast=settings.FAST_LOGGING)
     app = FastAPI(title="Forex RL Trading API")
     event_bus = EventBus()
     candle_store = CandleStore(settings.DB_PATH)
@@ -66,14 +68,16 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         response.headers["X-Trace-Id"] = trace_id
         return trace_id
 
-    def get_news(request: Request) -> NewsService:
-        return request.app.state.news_service
+    async def get_news() -> NewsService:
+        # Closure lookup, and async so FastAPI does not hop to the threadpool.
+        return news_service
 
     @app.get("/api/health")
-    async def health(trace_id: str = Depends(trace_dependency)) -> dict[str, str | None]:
+    async def health(trace_id: str = Depends(trace_dependency)) -> dict[str, str | dict[str, str] | None]:
         status_payload: EngineStatus = await engine.status()
         instrument = status_payload.instrument or "EUR_USD"
-        latest_candle = candle_store.latest(instrument)
+        latest = candle_store.latest_many(status_payload.instruments or [instrument])
+        latest_candle = latest.get(instrument)
         return {
             "status": "ok",
             "trace_id": trace_id,
@@ -81,6 +85,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             "broker": settings.BROKER,
             "heartbeat_ts": status_payload.heartbeat_ts.isoformat(),
             "latest_data_ts": latest_candle.timestamp.isoformat() if latest_candle else None,
+            "latest_data_by_instrument": {
+                name: candle.timestamp.isoformat() for name, candle in latest.items()
+            },
         }
 
     @app.get("/api/status", response_model=EngineStatus)
@@ -94,10 +101,25 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     @app.post("/api/session/start")
     async def session_start(payload: dict, trace_id: str = Depends(trace_dependency)) -> dict[str, str | bool]:
-        instrument = payload.get("instrument", "EUR_USD")
+        instruments = payload.get("instruments")
+        if instruments is not None and (
+            not isinstance(instruments, list)
+            or not instruments
+            or not all(isinstance(name, str) and name for name in instruments)
+        ):
+            raise HTTPException(status_code=422, detail="instruments must be a non-empty list of instrument names")
+        # ``instrument`` is the primary and runs first; ``instruments`` adds to it.
+        instrument = payload.get("instrument") or (instruments[0] if instruments else "EUR_USD")
+        if not isinstance(instrument, str):
+            raise HTTPException(status_code=422, detail="instrument must be an instrument name")
         timeframe = payload.get("tf", "M5")
         mode = payload.get("mode", "paper")
-        run_id = await engine.start(instrument=instrument, timeframe=timeframe, mode=mode)
+        run_id = await engine.start(
+            instrument=instrument,
+            timeframe=timeframe,
+            mode=mode,
+            instruments=instruments,
+        )
         return {"trace_id": trace_id, "run_id": run_id, "mode": mode}
 
     @app.post("/api/session/stop")
@@ -125,14 +147,20 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     @app.get("/api/events/stream")
     async def events_stream(trace_id: str = Depends(trace_dependency)) -> StreamingResponse:
         async def generator():
-            queue = await event_bus.subscribe("events")
+            queue = event_bus.subscribe("events")
             try:
+                trace_prefix = b'{"trace_id":' + json.dumps(trace_id).encode() + b","
                 while True:
                     item = await queue.get()
-                    payload = {"trace_id": trace_id, **item}
-                    yield f"data: {json.dumps(payload)}\n\n"
+                    if isinstance(item, bytes):
+                        # Pre-encoded by the engine: splice the trace id into
+                        # the shared payload rather than re-serialising it.
+                        data = trace_prefix + item[1:]
+                    else:
+                        data = encode_message({"trace_id": trace_id, **item})
+                    yield b"data: " + data + b"\n\n"
             finally:
-                await event_bus.unsubscribe("events", queue)
+                event_bus.unsubscribe("events", queue)
 
         return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -155,11 +183,17 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     async def backtest_run(payload: dict, trace_id: str = Depends(trace_dependency)) -> BacktestResult:
         symbol = payload.get("symbol", "EUR_USD")
         start = datetime.fromisoformat(payload["start"]) if "start" in payload else datetime.utcnow() - timedelta(days=7)
+        steps = payload.get("max_bars", 500)
+        if isinstance(steps, bool) or not isinstance(steps, int) or not 1 <= steps <= MAX_BACKTEST_BARS:
+            raise HTTPException(
+                status_code=422,
+                detail=f"max_bars must be an integer between 1 and {MAX_BACKTEST_BARS}",
+            )
         candles = list(
             generate_synthetic_candles(
                 instrument=symbol,
                 start=start,
-                steps=500,
+                steps=steps,
                 base_price=1.1,
                 interval=timedelta(minutes=5),
             )
@@ -227,7 +261,4 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     return app
 
 
-app = create_app()
-
-
-__all__ = ["create_app", "app"]
+__all__ = ["create_app"]
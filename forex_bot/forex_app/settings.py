@@ -5,7 +5,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, Field, PositiveFloat, SecretStr
+from pydantic import AliasChoices, BaseModel, Field, PositiveFloat, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -53,6 +53,10 @@ class Settings(BaseSettings):
     MODEL_PATH: Path = Path("data/models/ppo_fx.zip")
 
     HEARTBEAT_INTERVAL_SECONDS: PositiveFloat = PositiveFloat(5.0)  # type: ignore[arg-type]
+    # Use the numba candle kernel; FOREX_BOT_NUMBA is accepted as an alias.
+    FAST_MATH: bool = Field(default=False, validation_alias=AliasChoices("FAST_MATH", "FOREX_BOT_NUMBA"))
+    # Epoch-float log timestamps and no per-record thread/process lookups.
+    FAST_LOGGING: bool = False
 
 class SettingsUpdate(BaseModel):
     """Partial update payload for mutable settings exposed over the API."""
@@ -1,8 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+from forex_app.broker import PaperBroker  # noqa: E402
+from forex_app.data import MEMORY_DB, CandleStore  # noqa: E402
+from forex_app.engine import TradingEngine  # noqa: E402
+from forex_app.event_bus import EventBus  # noqa: E402
+from forex_app.news import NewsService  # noqa: E402
+from forex_app.routes import create_app  # noqa: E402
+from forex_app.settings import Settings  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    """Parsed and validated once; tests derive variants with ``model_copy``."""
+
+    return Settings()
+
+
+@pytest.fixture
+def app(tmp_path, base_settings):
+    settings = base_settings.model_copy(
+        update={
+            "DB_PATH": Path(MEMORY_DB),
+            "DATA_DIR": tmp_path / "data",
+            # The loop never fires on its own; tests drive it with engine.tick_now().
+            "HEARTBEAT_INTERVAL_SECONDS": 3600.0,
+        }
+    )
+    app = create_app(settings)
+    app.state.news_service.fetch_news = lambda: asyncio.sleep(0, result=[])  # type: ignore[assignment]
+    return app
+
+
+@pytest_asyncio.fixture
+async def api_client(app):
+    # One in-process transport per app; every request in the test reuses it.
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+@pytest.fixture
+def engine(tmp_path, base_settings) -> TradingEngine:
+    """A fresh engine wired from already-imported modules; nothing is reloaded."""
+
+    settings = base_settings.model_copy(
+        update={"DB_PATH": Path(MEMORY_DB), "DATA_DIR": tmp_path / "data"}
+    )
+    return TradingEngine(
+        settings=settings,
+        broker=PaperBroker(),
+        candle_store=CandleStore(settings.DB_PATH),
+        event_bus=EventBus(),
+        news_service=NewsService(settings),
+    )
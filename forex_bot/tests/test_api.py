@@ -1,64 +1,81 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-import pytest
-from httpx import AsyncClient
 
-from forex_app.routes import create_app
-from forex_app.settings import Settings
+async def test_api_lifecycle(app, api_client) -> None:
+    health = await api_client.get("/api/health")
+    assert health.status_code == 200
+    payload = health.json()
+    assert payload["status"] == "ok"
 
+    start_resp = await api_client.post("/api/session/start", json={"instrument": "EUR_USD", "tf": "M5"})
+    assert start_resp.status_code == 200
+    run_id = start_resp.json()["run_id"]
+    assert run_id
 
-@pytest.mark.asyncio
-async def test_api_lifecycle(tmp_path) -> None:
-    settings = Settings(
-        DB_PATH=tmp_path / "trading.db",
-        DATA_DIR=tmp_path / "data",
-        HEARTBEAT_INTERVAL_SECONDS=0.01,
+    await asyncio.wait_for(app.state.engine.tick_now(), timeout=1.0)
+
+    status_resp = await api_client.get("/api/status")
+    assert status_resp.status_code == 200
+    status_payload = status_resp.json()
+    assert status_payload["run_id"] == run_id
+
+    stop_resp = await api_client.post("/api/session/stop")
+    assert stop_resp.status_code == 200
+
+    metrics_resp = await api_client.get("/api/metrics")
+    assert metrics_resp.status_code == 200
+
+    settings_resp = await api_client.post("/api/settings", json={"TRADE_ALLOCATION_PCT": 0.03})
+    assert settings_resp.status_code == 200
+
+    now = datetime.now(timezone.utc)
+    backtest_resp = await api_client.post(
+        "/api/backtest/run",
+        json={
+            "symbol": "EUR_USD",
+            "start": (now - timedelta(minutes=30)).isoformat(),
+            "end": now.isoformat(),
+            "max_bars": 32,
+        },
+    )
+    assert backtest_resp.status_code == 200
+    backtest_payload = backtest_resp.json()
+    assert "equity_curve" in backtest_payload
+    assert "stats" in backtest_payload
+
+    news_resp = await api_client.get("/api/news")
+    assert news_resp.status_code == 200
+
+
+async def test_backtest_rejects_invalid_max_bars(api_client) -> None:
+    for max_bars in (-1, 0, "lots", 10**6):
+        resp = await api_client.post("/api/backtest/run", json={"symbol": "EUR_USD", "max_bars": max_bars})
+        assert resp.status_code == 422
+
+
+async def test_session_runs_several_instruments(app, api_client) -> None:
+    start_resp = await api_client.post(
+        "/api/session/start", json={"instrument": "EUR_USD", "instruments": ["GBP_USD", "EUR_USD"], "tf": "M5"}
     )
-    app = create_app(settings)
-    app.state.news_service.fetch_news = lambda: asyncio.sleep(0, result=[])  # type: ignore[assignment]
-
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        health = await client.get("/api/health")
-        assert health.status_code == 200
-        payload = health.json()
-        assert payload["status"] == "ok"
-
-        start_resp = await client.post("/api/session/start", json={"instrument": "EUR_USD", "tf": "M5"})
-        assert start_resp.status_code == 200
-        run_id = start_resp.json()["run_id"]
-        assert run_id
-
-        await asyncio.sleep(0.05)
-
-        status_resp = await client.get("/api/status")
-        assert status_resp.status_code == 200
-        status_payload = status_resp.json()
-        assert status_payload["run_id"] == run_id
-
-        stop_resp = await client.post("/api/session/stop")
-        assert stop_resp.status_code == 200
-
-        metrics_resp = await client.get("/api/metrics")
-        assert metrics_resp.status_code == 200
-
-        settings_resp = await client.post("/api/settings", json={"TRADE_ALLOCATION_PCT": 0.03})
-        assert settings_resp.status_code == 200
-
-        backtest_resp = await client.post(
-            "/api/backtest/run",
-            json={
-                "symbol": "EUR_USD",
-                "start": (datetime.utcnow() - timedelta(days=2)).isoformat(),
-                "end": datetime.utcnow().isoformat(),
-            },
-        )
-        assert backtest_resp.status_code == 200
-        backtest_payload = backtest_resp.json()
-        assert "equity_curve" in backtest_payload
-        assert "stats" in backtest_payload
-
-        news_resp = await client.get("/api/news")
-        assert news_resp.status_code == 200
+    assert start_resp.status_code == 200
+
+    engine = app.state.engine
+    await asyncio.wait_for(engine.tick_now(), timeout=1.0)
+    await engine._drain_writes()
+
+    status_payload = (await api_client.get("/api/status")).json()
+    assert status_payload["instrument"] == "EUR_USD"
+    assert status_payload["instruments"] == ["EUR_USD", "GBP_USD"]
+    health = (await api_client.get("/api/health")).json()
+    assert set(health["latest_data_by_instrument"]) == {"EUR_USD", "GBP_USD"}
+
+    await api_client.post("/api/session/stop")
+
+
+async def test_session_rejects_invalid_instruments(api_client) -> None:
+    for instruments in ("GBP_USD", [], ["EUR_USD", 3], [""]):
+        resp = await api_client.post("/api/session/start", json={"instruments": instruments})
+        assert resp.status_code == 422
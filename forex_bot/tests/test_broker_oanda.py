@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from forex.broker.oanda import OANDA_API, OandaBroker
+from forex.config import reset_settings_cache
+
+
+@pytest.fixture
+def oanda_env(monkeypatch):
+    monkeypatch.setenv("OANDA_ACCOUNT_ID", "101-001-1")
+    monkeypatch.setenv("OANDA_API_TOKEN", "test-token")
+    yield
+    reset_settings_cache()
+
+
+async def test_get_account(oanda_env) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"account": {"balance": "100000"}})
+
+    broker = OandaBroker(transport=httpx.MockTransport(handler))
+    account = await broker.get_account()
+
+    assert account == {"balance": "100000"}
+    assert str(seen[0].url) == f"{OANDA_API}/accounts/101-001-1"
+    assert seen[0].headers["Authorization"] == "Bearer test-token"
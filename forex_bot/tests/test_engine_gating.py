@@ -5,31 +5,17 @@ from types import MethodType
 
 import pytest
 
-from forex_app.broker import PaperBroker
-from forex_app.data import CandleStore, generate_synthetic_candles
-from forex_app.engine import TradingEngine
-from forex_app.event_bus import EventBus
-from forex_app.models import Signal, SignalDirection
-from forex_app.news import NewsService
-from forex_app.settings import Settings
-
-
-@pytest.mark.asyncio
-async def test_engine_blocks_low_confidence_signal(tmp_path) -> None:
-    settings = Settings(DB_PATH=tmp_path / "trading.db", DATA_DIR=tmp_path / "data")
-    candle_store = CandleStore(settings.DB_PATH)
-    event_bus = EventBus()
-    news_service = NewsService(settings)
-    engine = TradingEngine(
-        settings=settings,
-        broker=PaperBroker(),
-        candle_store=candle_store,
-        event_bus=event_bus,
-        news_service=news_service,
-    )
+from forex_app.data import generate_synthetic_candles
+from forex_app.models import Candle, OrderIntent, Signal, SignalDirection
+
 
-    start = datetime.utcnow() - timedelta(minutes=200)
-    candles = list(
+@pytest.fixture(scope="module")
+def synthetic_candles() -> list[Candle]:
+    # Deterministic (seeded) and never mutated, so one list serves every test;
+    # each test still adds them to its own per-tmp_path store. A fixed start
+    # keeps the timestamps identical from run to run.
+    start = datetime(2024, 1, 1)
+    return list(
         generate_synthetic_candles(
             instrument="EUR_USD",
             start=start,
@@ -38,13 +24,44 @@ async def test_engine_blocks_low_confidence_signal(tmp_path) -> None:
             interval=timedelta(minutes=1),
         )
     )
+
+
+async def test_engine_blocks_low_confidence_signal(engine, synthetic_candles) -> None:
+    candle_store = engine.candle_store
+    candles = synthetic_candles
+
     for candle in candles[:-1]:
         candle_store.add(candle)
     low_conf_signal = Signal(direction=SignalDirection.LONG, confidence=0.2, reason_codes=["low_conf"], features=None)
 
-    engine._forced_signal = low_conf_signal
+    await engine.force_signal(low_conf_signal)
 
     await engine._process_candle(candles[-1])
+    await engine._drain_writes()
 
     assert engine.stages["rl"].status == "blocked"
     assert engine._idle_reason in {"No actionable signal", "No open positions"}
+
+
+async def test_engine_exits_only_positions_of_candle_instrument(engine) -> None:
+    position = await engine.broker.place_order(
+        OrderIntent(instrument="EUR_USD", side=SignalDirection.LONG, units=1000, price=1.1, stop_loss=1.09)
+    )
+    engine._open_positions = 1
+    engine._tick_ts = datetime(2024, 1, 1)
+    flat = Signal(direction=SignalDirection.FLAT, confidence=0.0, reason_codes=[], features=None)
+    account = await engine.broker.account_summary()
+
+    # A USD_JPY candle trades far below the EUR_USD stop but must not touch it.
+    jpy_candle = Candle(
+        instrument="USD_JPY", timestamp=datetime(2024, 1, 1), open=0.5, high=0.5, low=0.5, close=0.5, volume=1.0
+    )
+    await engine._evaluate_positions(jpy_candle, flat, account)
+    assert position.id in engine.broker.positions
+
+    eur_candle = Candle(
+        instrument="EUR_USD", timestamp=datetime(2024, 1, 1), open=1.1, high=1.1, low=1.08, close=1.085, volume=1.0
+    )
+    await engine._evaluate_positions(eur_candle, flat, account)
+    assert position.id not in engine.broker.positions
+    assert engine.broker.closed_positions[-1].reason == "stop_loss"
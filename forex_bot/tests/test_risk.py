@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from forex_app.risk import RiskManager, estimate_pip_value
-from forex_app.settings import Settings
 from forex_app.models import SignalDirection
 
 
-def test_position_plan_respects_risk_budget() -> None:
-    settings = Settings()
+def test_position_plan_respects_risk_budget(base_settings) -> None:
+    settings = base_settings
     manager = RiskManager(settings)
     equity = 100_000.0
     price = 1.2